@@ -1,8 +1,113 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
+import numpy as np
+import json
+from collections import namedtuple
+
+# Base consumption in kWh per day for different appliances
+_BASE_CONSUMPTION = {
+    'flat': {
+        '1BHK': {
+            'lighting': 1.5,
+            'fan_ac': 4.0,
+            'appliances': 3.5,
+            'water_heater': 2.0,
+            'refrigerator': 1.8
+        },
+        '2BHK': {
+            'lighting': 2.2,
+            'fan_ac': 6.0,
+            'appliances': 4.5,
+            'water_heater': 2.5,
+            'refrigerator': 2.0
+        },
+        '3BHK': {
+            'lighting': 3.0,
+            'fan_ac': 8.0,
+            'appliances': 6.0,
+            'water_heater': 3.0,
+            'refrigerator': 2.2
+        }
+    },
+    'tenement': {
+        '1BHK': {
+            'lighting': 1.8,
+            'fan_ac': 5.0,
+            'appliances': 3.0,
+            'water_heater': 1.5,
+            'refrigerator': 1.6
+        },
+        '2BHK': {
+            'lighting': 2.5,
+            'fan_ac': 7.0,
+            'appliances': 4.0,
+            'water_heater': 2.0,
+            'refrigerator': 1.8
+        },
+        '3BHK': {
+            'lighting': 3.5,
+            'fan_ac': 9.0,
+            'appliances': 5.5,
+            'water_heater': 2.5,
+            'refrigerator': 2.0
+        }
+    }
+}
+
+# Temperature breakpoints (°C) and the matching fan/AC usage multipliers:
+# very cold, cool, comfortable, warm, hot, very hot (AC usage increases)
+_BINS = np.array([18, 22, 26, 30, 35])
+_MULT = np.array([0.1, 0.3, 0.6, 0.8, 1.0, 1.3])
+
+# Weather card (description, background gradient) for each temperature band, aligned with _MULT
+_WEATHER = (
+    ("❄️ Very Cold", "linear-gradient(135deg, #74b9ff, #0984e3)"),
+    ("🌤️ Cool", "linear-gradient(135deg, #00cec9, #00b894)"),
+    ("😊 Comfortable", "linear-gradient(135deg, #00b894, #55a3ff)"),
+    ("🌞 Warm", "linear-gradient(135deg, #fdcb6e, #f39c12)"),
+    ("🔥 Hot", "linear-gradient(135deg, #fd79a8, #e84393)"),
+    ("🌋 Very Hot", "linear-gradient(135deg, #ff6b6b, #ee5253)")
+)
+
+# 5-stop YlOrRd palette (as RGB) used to shade the weekly Total Energy column
+_YLORRD = np.array([
+    [0xff, 0xff, 0xcc],
+    [0xfe, 0xd9, 0x76],
+    [0xfd, 0x8d, 0x3c],
+    [0xe3, 0x1a, 0x1c],
+    [0x80, 0x00, 0x26]
+], dtype=np.float64)
+
+# Positions of each category in the array returned by calculate_daily_energy
+CAT_LIGHTING = 0
+CAT_FAN_AC = 1
+CAT_APPLIANCES = 2
+CAT_WATER_HEATER = 3
+CAT_REFRIGERATOR = 4
+CAT_TOTAL = 5
+
+# Pie chart labels, in CAT_* order
+_BREAKDOWN_CATEGORIES = ('💡 Lighting', '🌀 Fan/AC', '📱 Appliances', '🚿 Water Heater', '❄️ Refrigerator')
+
+# Weekly figures the energy saving recommendations are chosen from
+_Stats = namedtuple('_Stats', ['avg_temp', 'avg_energy', 'flat_tenement'])
+
+# Energy saving recommendations as (predicate, message) rules, in display order
+_RULES = (
+    (lambda s: s.avg_temp > 30, "🔥 Install ceiling fans to reduce AC load by 20-30%"),
+    (lambda s: s.avg_temp > 30, "🌞 Use solar water heater to reduce electricity consumption"),
+    (lambda s: s.avg_temp > 30, "🏠 Improve insulation to maintain cool temperatures"),
+    (lambda s: s.avg_energy > 15, "💡 Switch to LED lights to reduce lighting energy by 80%"),
+    (lambda s: s.avg_energy > 15, "⭐ Look for 5-star rated appliances for better efficiency"),
+    (lambda s: s.avg_energy > 15, "🕒 Use timer-based water heaters"),
+    (lambda s: s.flat_tenement == "tenement", "🏡 Consider rainwater harvesting to reduce water heating needs"),
+    (lambda s: s.flat_tenement == "tenement", "🌱 Plant trees around the house for natural cooling")
+)
+
+# Recommendations shown to every household after the rule-based ones
+_ALWAYS_TIPS = (
+    "📱 Use smart power strips to eliminate standby power consumption",
+    "🌀 Set AC temperature to 24°C instead of lower temperatures"
+)
 
 def calculate_base_energy(flat_tenement, bhk):
     """
@@ -16,89 +121,35 @@ def calculate_base_energy(flat_tenement, bhk):
     Returns:
         dict: Base energy consumption breakdown
     """
-    # Base consumption in kWh per day for different appliances
-    base_consumption = {
-        'flat': {
-            '1BHK': {
-                'lighting': 1.5,
-                'fan_ac': 4.0,
-                'appliances': 3.5,
-                'water_heater': 2.0,
-                'refrigerator': 1.8
-            },
-            '2BHK': {
-                'lighting': 2.2,
-                'fan_ac': 6.0,
-                'appliances': 4.5,
-                'water_heater': 2.5,
-                'refrigerator': 2.0
-            },
-            '3BHK': {
-                'lighting': 3.0,
-                'fan_ac': 8.0,
-                'appliances': 6.0,
-                'water_heater': 3.0,
-                'refrigerator': 2.2
-            }
-        },
-        'tenement': {
-            '1BHK': {
-                'lighting': 1.8,
-                'fan_ac': 5.0,
-                'appliances': 3.0,
-                'water_heater': 1.5,
-                'refrigerator': 1.6
-            },
-            '2BHK': {
-                'lighting': 2.5,
-                'fan_ac': 7.0,
-                'appliances': 4.0,
-                'water_heater': 2.0,
-                'refrigerator': 1.8
-            },
-            '3BHK': {
-                'lighting': 3.5,
-                'fan_ac': 9.0,
-                'appliances': 5.5,
-                'water_heater': 2.5,
-                'refrigerator': 2.0
-            }
-        }
-    }
+    return _BASE_CONSUMPTION.get(flat_tenement, {}).get(bhk, {})
+
+def _temperature_band(temperature):
+    """
+    Index of the temperature band, shared by the _MULT and _WEATHER lookups
     
-    return base_consumption.get(flat_tenement, {}).get(bhk, {})
+    Args:
+        temperature (float or np.ndarray): Temperature in Celsius
+    
+    Returns:
+        int or np.ndarray: Band index, 0 (very cold) to 5 (very hot)
+    """
+    # side='right' puts a temperature sitting on a breakpoint in the upper band
+    return np.searchsorted(_BINS, temperature, side='right')
 
 def calculate_weather_adjustment(temperature, base_fan_ac):
     """
     Adjust fan/AC consumption based on temperature
     
     Args:
-        temperature (float): Temperature in Celsius
+        temperature (float or np.ndarray): Temperature in Celsius
         base_fan_ac (float): Base fan/AC consumption
     
     Returns:
-        float: Adjusted fan/AC consumption
-    """
-    if temperature < 18:
-        # Very cold - minimal fan usage
-        return base_fan_ac * 0.1
-    elif temperature < 22:
-        # Cool - reduced fan usage
-        return base_fan_ac * 0.3
-    elif temperature < 26:
-        # Comfortable - normal fan usage
-        return base_fan_ac * 0.6
-    elif temperature < 30:
-        # Warm - increased fan usage
-        return base_fan_ac * 0.8
-    elif temperature < 35:
-        # Hot - maximum fan usage
-        return base_fan_ac * 1.0
-    else:
-        # Very hot - AC usage increases
-        return base_fan_ac * 1.3
-
-def calculate_daily_energy(flat_tenement, bhk, temperature):
+        float or np.ndarray: Adjusted fan/AC consumption
+    """
+    return base_fan_ac * _MULT[_temperature_band(temperature)]
+
+def calculate_daily_energy(flat_tenement, bhk, temperature, band=None):
     """
     Calculate daily energy consumption with weather adjustment
     
@@ -106,260 +157,709 @@ def calculate_daily_energy(flat_tenement, bhk, temperature):
         flat_tenement (str): Housing type
         bhk (str): BHK configuration
         temperature (float): Daily temperature
+        band (int, optional): Temperature band from _temperature_band, if already known
     
     Returns:
-        dict: Daily energy consumption breakdown
+        np.ndarray: Daily energy consumption breakdown, indexed by the CAT_* constants
     """
     base_energy = calculate_base_energy(flat_tenement, bhk)
     if not base_energy:
         return None
     
-    # Apply weather adjustment to fan/AC consumption
-    adjusted_fan_ac = calculate_weather_adjustment(temperature, base_energy['fan_ac'])
-    
-    daily_consumption = {
-        'lighting': base_energy['lighting'],
-        'fan_ac': adjusted_fan_ac,
-        'appliances': base_energy['appliances'],
-        'water_heater': base_energy['water_heater'],
-        'refrigerator': base_energy['refrigerator']
-    }
+    if band is None:
+        band = _temperature_band(temperature)
     
-    daily_consumption['total'] = sum(daily_consumption.values())
+    daily_consumption = np.empty(CAT_TOTAL + 1)
+    daily_consumption[CAT_LIGHTING] = base_energy['lighting']
+    # Apply weather adjustment to fan/AC consumption
+    daily_consumption[CAT_FAN_AC] = base_energy['fan_ac'] * _MULT[band]
+    daily_consumption[CAT_APPLIANCES] = base_energy['appliances']
+    daily_consumption[CAT_WATER_HEATER] = base_energy['water_heater']
+    daily_consumption[CAT_REFRIGERATOR] = base_energy['refrigerator']
+    daily_consumption[CAT_TOTAL] = daily_consumption[:CAT_TOTAL].sum()
     
     return daily_consumption
 
-def main():
-    # Custom CSS for bright, glowing UI
-    st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap');
+def _batch_daily(fan_ac, lighting, appliances, water_heater, refrigerator):
+    """
+    Total daily energy for a batch of days in one vectorized expression
     
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #f5576c 75%, #4facfe 100%);
-        background-size: 400% 400%;
-        animation: gradientShift 10s ease infinite;
-    }
+    Args:
+        fan_ac (np.ndarray): Weather-adjusted fan/AC consumption per day,
+            from calculate_weather_adjustment
+        lighting (float): Base lighting consumption
+        appliances (float): Base appliances consumption
+        water_heater (float): Base water heater consumption
+        refrigerator (float): Base refrigerator consumption
     
-    @keyframes gradientShift {
-        0% { background-position: 0% 50%; }
-        50% { background-position: 100% 50%; }
-        100% { background-position: 0% 50%; }
-    }
+    Returns:
+        np.ndarray: Total kWh per day
+    """
+    return (lighting + appliances + water_heater + refrigerator) + fan_ac
+
+def calculate_weekly_energy(flat_tenement, bhk, days, temperatures):
+    """
+    Calculate energy consumption for every day of the week in one pass
     
-    .main-header {
-        text-align: center;
-        background: linear-gradient(135deg, #ff6b6b, #feca57, #48dbfb, #ff9ff3);
-        background-size: 400% 400%;
-        animation: gradientShift 6s ease infinite;
-        color: white;
-        padding: 2rem;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        border: 2px solid rgba(255,255,255,0.2);
-        backdrop-filter: blur(10px);
-    }
+    Args:
+        flat_tenement (str): Housing type
+        bhk (str): BHK configuration
+        days (list): Day names, one per temperature
+        temperatures (np.ndarray): Daily temperatures in Celsius
     
-    .main-header h1 {
-        font-family: 'Poppins', sans-serif;
-        font-weight: 700;
-        font-size: 2.5rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        margin: 0;
-    }
+    Returns:
+        pd.DataFrame: One row per day with total and per-category energy
+    """
+    # Deferred so pandas is only loaded once the weekly summary is needed
+    import pandas as pd
     
-    .main-header p {
-        font-family: 'Poppins', sans-serif;
-        font-weight: 300;
-        font-size: 1.2rem;
-        margin: 0;
-        opacity: 0.9;
-    }
+    base_energy = calculate_base_energy(flat_tenement, bhk)
+    if not base_energy:
+        return None
     
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 10px;
-        background: rgba(255,255,255,0.1);
-        padding: 10px;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+    n = temperatures.size
+    
+    # Apply weather adjustment to fan/AC consumption for all days at once
+    fan_ac = calculate_weather_adjustment(temperatures, base_energy['fan_ac'])
+    
+    # Columns are already typed NumPy arrays, so let pandas adopt them as-is
+    cols = {
+        'Day': np.asarray(days, dtype=object),
+        'Temperature': temperatures,
+        'Total Energy': _batch_daily(
+            fan_ac,
+            base_energy['lighting'],
+            base_energy['appliances'],
+            base_energy['water_heater'],
+            base_energy['refrigerator']
+        ),
+        'Lighting': np.full(n, base_energy['lighting']),
+        'Fan/AC': fan_ac,
+        'Appliances': np.full(n, base_energy['appliances']),
+        'Water Heater': np.full(n, base_energy['water_heater']),
+        'Refrigerator': np.full(n, base_energy['refrigerator'])
     }
     
-    .stTabs [data-baseweb="tab"] {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        border-radius: 15px;
-        padding: 10px 20px;
-        font-weight: 600;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        transition: all 0.3s ease;
-        border: none;
-    }
+    return pd.DataFrame(cols, copy=False)
+
+@st.cache_data
+def _css():
+    """
+    Custom CSS for the bright, glowing UI, built once per process
     
-    .stTabs [data-baseweb="tab"]:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-    }
+    Returns:
+        str: Stylesheet contents without the surrounding <style> tags
+    """
+    return """
+@import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;600;700&display=swap');
+
+.stApp {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 25%, #f093fb 50%, #f5576c 75%, #4facfe 100%);
+    background-size: 400% 400%;
+    animation: gradientShift 10s ease infinite;
+}
+
+@keyframes gradientShift {
+    0% { background-position: 0% 50%; }
+    50% { background-position: 100% 50%; }
+    100% { background-position: 0% 50%; }
+}
+
+.main-header {
+    text-align: center;
+    background: linear-gradient(135deg, #ff6b6b, #feca57, #48dbfb, #ff9ff3);
+    background-size: 400% 400%;
+    animation: gradientShift 6s ease infinite;
+    color: white;
+    padding: 2rem;
+    border-radius: 20px;
+    margin-bottom: 2rem;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+    border: 2px solid rgba(255,255,255,0.2);
+    backdrop-filter: blur(10px);
+}
+
+.main-header h1 {
+    font-family: 'Poppins', sans-serif;
+    font-weight: 700;
+    font-size: 2.5rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+    margin: 0;
+}
+
+.main-header p {
+    font-family: 'Poppins', sans-serif;
+    font-weight: 300;
+    font-size: 1.2rem;
+    margin: 0;
+    opacity: 0.9;
+}
+
+.stTabs [data-baseweb="tab-list"] {
+    gap: 10px;
+    background: rgba(255,255,255,0.1);
+    padding: 10px;
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+}
+
+.stTabs [data-baseweb="tab"] {
+    background: linear-gradient(135deg, #667eea, #764ba2);
+    color: white;
+    border-radius: 15px;
+    padding: 10px 20px;
+    font-weight: 600;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+    border: none;
+}
+
+.stTabs [data-baseweb="tab"]:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.3);
+}
+
+.stTabs [aria-selected="true"] {
+    background: linear-gradient(135deg, #ff6b6b, #feca57) !important;
+    animation: glow 2s ease-in-out infinite alternate;
+}
+
+@keyframes glow {
+    from { box-shadow: 0 5px 15px rgba(255,107,107,0.5); }
+    to { box-shadow: 0 8px 25px rgba(255,107,107,0.8); }
+}
+
+.stSidebar {
+    background: linear-gradient(180deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
+    backdrop-filter: blur(10px);
+    border-right: 2px solid rgba(255,255,255,0.2);
+}
+
+.stMetric {
+    background: linear-gradient(135deg, rgba(255,255,255,0.2), rgba(255,255,255,0.1));
+    padding: 1rem;
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255,255,255,0.3);
+    box-shadow: 0 8px 25px rgba(0,0,0,0.2);
+}
+
+.stMetric label {
+    color: white !important;
+    font-weight: 600;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
+}
+
+.stMetric [data-testid="metric-value"] {
+    color: #fff !important;
+    font-weight: 700;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.4);
+}
+
+.weather-card {
+    background: linear-gradient(135deg, #667eea, #764ba2);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 20px;
+    margin: 1rem 0;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+    border: 2px solid rgba(255,255,255,0.2);
+    backdrop-filter: blur(10px);
+    animation: float 3s ease-in-out infinite;
+}
+
+@keyframes float {
+    0%, 100% { transform: translateY(0px); }
+    50% { transform: translateY(-5px); }
+}
+
+.stButton > button {
+    background: linear-gradient(135deg, #ff6b6b, #feca57);
+    color: white;
+    border: none;
+    border-radius: 15px;
+    padding: 0.7rem 2rem;
+    font-weight: 600;
+    font-size: 1.1rem;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px rgba(255,107,107,0.4);
+}
+
+.stDataFrame {
+    background: rgba(255,255,255,0.9);
+    border-radius: 15px;
+    padding: 1rem;
+    backdrop-filter: blur(10px);
+    box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+}
+
+.stExpander {
+    background: rgba(255,255,255,0.1);
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255,255,255,0.3);
+}
+
+.stTextInput > div > div > input {
+    background: rgba(255,255,255,0.9);
+    border: 2px solid rgba(255,255,255,0.3);
+    border-radius: 10px;
+    color: #333;
+    font-weight: 500;
+}
+
+.stTextInput > div > div > input:focus {
+    border-color: #667eea;
+    box-shadow: 0 0 10px rgba(102,126,234,0.5);
+}
+
+.stNumberInput > div > div > input {
+    background: rgba(255,255,255,0.9);
+    border: 2px solid rgba(255,255,255,0.3);
+    border-radius: 10px;
+    color: #333;
+    font-weight: 500;
+}
+
+.stSlider {
+    background: rgba(255,255,255,0.1);
+    padding: 1rem;
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+}
+
+.stAlert {
+    background: rgba(255,255,255,0.9);
+    border-radius: 15px;
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(255,255,255,0.3);
+}
+
+h1, h2, h3 {
+    font-family: 'Poppins', sans-serif;
+    color: white;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.stMarkdown {
+    color: white;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
+}
+
+.bright-card {
+    background: linear-gradient(135deg, #667eea, #764ba2);
+    color: white;
+    padding: 1.5rem;
+    border-radius: 20px;
+    margin: 1rem 0;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+    border: 2px solid rgba(255,255,255,0.2);
+    backdrop-filter: blur(10px);
+}
+
+.glow-text {
+    text-shadow: 0 0 10px rgba(255,255,255,0.8);
+    font-weight: 700;
+}
+"""
+
+def _pie_fig(values, names, title):
+    """
+    Build the daily energy breakdown pie chart
     
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #ff6b6b, #feca57) !important;
-        animation: glow 2s ease-in-out infinite alternate;
-    }
+    Args:
+        values (tuple): Energy per category in kWh
+        names (tuple): Category labels
+        title (str): Chart title
     
-    @keyframes glow {
-        from { box-shadow: 0 5px 15px rgba(255,107,107,0.5); }
-        to { box-shadow: 0 8px 25px rgba(255,107,107,0.8); }
-    }
+    Returns:
+        go.Figure: Styled pie chart
+    """
+    # Plotly is only needed once charts are drawn, so defer loading it
+    import plotly.express as px
+    
+    fig = px.pie(
+        values=list(values),
+        names=list(names),
+        title=title,
+        color_discrete_sequence=['#ff6b6b', '#feca57', '#48dbfb', '#ff9ff3', '#54a0ff']
+    )
+    fig.update_layout(
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        title_font_color='white',
+        title_font_size=18,
+        font_color='white',
+        title_x=0.5
+    )
+    return fig
+
+def _weekly_line(days, energies):
+    """
+    Build the weekly energy trend line chart
     
-    .stSidebar {
-        background: linear-gradient(180deg, rgba(255,255,255,0.1), rgba(255,255,255,0.05));
-        backdrop-filter: blur(10px);
-        border-right: 2px solid rgba(255,255,255,0.2);
-    }
+    Args:
+        days (tuple): Day names
+        energies (tuple): Total energy per day in kWh
     
-    .stMetric {
-        background: linear-gradient(135deg, rgba(255,255,255,0.2), rgba(255,255,255,0.1));
-        padding: 1rem;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.3);
-        box-shadow: 0 8px 25px rgba(0,0,0,0.2);
-    }
+    Returns:
+        go.Figure: Styled line chart
+    """
+    import pandas as pd
+    import plotly.express as px
+    
+    df = pd.DataFrame({'Day': days, 'Total Energy': energies})
+    fig_line = px.line(
+        df,
+        x='Day', 
+        y='Total Energy',
+        title='📈 Weekly Energy Consumption Trend',
+        markers=True,
+        color_discrete_sequence=['#ff6b6b']
+    )
+    fig_line.update_layout(
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        title_font_color='white',
+        title_font_size=18,
+        font_color='white',
+        title_x=0.5,
+        xaxis=dict(gridcolor='rgba(255,255,255,0.2)'),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.2)')
+    )
+    fig_line.update_traces(
+        line=dict(width=4),
+        marker=dict(size=10, line=dict(width=2, color='white'))
+    )
+    return fig_line
+
+def _scatter_with_trendline(days, temperatures, energies):
+    """
+    Build the temperature vs energy scatter plot with a least-squares trendline
     
-    .stMetric label {
-        color: white !important;
-        font-weight: 600;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-    }
+    Args:
+        days (tuple): Day names
+        temperatures (tuple): Temperature per day in Celsius
+        energies (tuple): Total energy per day in kWh
     
-    .stMetric [data-testid="metric-value"] {
-        color: #fff !important;
-        font-weight: 700;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.4);
-    }
+    Returns:
+        go.Figure: Styled scatter plot
+    """
+    import plotly.graph_objects as go
+    
+    x = np.asarray(temperatures, dtype=np.float64)
+    y = np.asarray(energies, dtype=np.float64)
+    
+    fig_scatter = go.Figure()
+    fig_scatter.add_trace(go.Scatter(
+        x=x,
+        y=y,
+        mode='markers',
+        customdata=days,
+        hovertemplate='Day=%{customdata}<br>Temperature=%{x}<br>Total Energy=%{y}<extra></extra>',
+        marker=dict(color='#feca57', size=12, line=dict(width=2, color='white')),
+        showlegend=False
+    ))
+    
+    # Closed-form 1-degree fit; skipped when every day has the same temperature
+    xmin, xmax = x.min(), x.max()
+    if xmax > xmin:
+        m, b = np.polyfit(x, y, 1)
+        fig_scatter.add_trace(go.Scatter(
+            x=[xmin, xmax],
+            y=[m * xmin + b, m * xmax + b],
+            mode='lines',
+            line=dict(color='#feca57'),
+            hovertemplate=f'Total Energy = {m:.4f} * Temperature + {b:.4f}<extra></extra>',
+            showlegend=False
+        ))
+    
+    fig_scatter.update_layout(
+        title='🌡️ Temperature vs Energy Consumption',
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        title_font_color='white',
+        title_font_size=18,
+        font_color='white',
+        title_x=0.5,
+        xaxis=dict(title='Temperature', gridcolor='rgba(255,255,255,0.2)'),
+        yaxis=dict(title='Total Energy', gridcolor='rgba(255,255,255,0.2)')
+    )
+    return fig_scatter
+
+_FIGURE_BUILDERS = {
+    'pie': _pie_fig,
+    'line': _weekly_line,
+    'scatter': _scatter_with_trendline
+}
+
+@st.cache_data(max_entries=256)
+def _fig_json(kind, payload):
+    """
+    Build a figure and serialize it to Plotly JSON, memoized on its inputs
     
-    .weather-card {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 20px;
-        margin: 1rem 0;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        border: 2px solid rgba(255,255,255,0.2);
-        backdrop-filter: blur(10px);
-        animation: float 3s ease-in-out infinite;
-    }
+    A cache hit skips the builder (and the trendline fit) entirely; the
+    string is parsed back into a plain dict by _plotly_chart.
     
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-5px); }
-    }
+    Args:
+        kind (str): Figure builder name, a key of _FIGURE_BUILDERS
+        payload (tuple): Hashable positional arguments for the builder
     
-    .stButton > button {
-        background: linear-gradient(135deg, #ff6b6b, #feca57);
-        color: white;
-        border: none;
-        border-radius: 15px;
-        padding: 0.7rem 2rem;
-        font-weight: 600;
-        font-size: 1.1rem;
-        box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        transition: all 0.3s ease;
-    }
+    Returns:
+        str: Serialized figure
+    """
+    import plotly.io as pio
     
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(255,107,107,0.4);
-    }
+    return pio.to_json(_FIGURE_BUILDERS[kind](*payload))
+
+def _plotly_chart(kind, *payload):
+    """
+    Render a cached figure with st.plotly_chart
     
-    .stDataFrame {
-        background: rgba(255,255,255,0.9);
-        border-radius: 15px;
-        padding: 1rem;
-        backdrop-filter: blur(10px);
-        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-    }
+    The cached JSON is handed over as a plain dict rather than rebuilt into a
+    go.Figure first; st.plotly_chart still validates it once on its own.
     
-    .stExpander {
-        background: rgba(255,255,255,0.1);
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
+    Args:
+        kind (str): Figure builder name, a key of _FIGURE_BUILDERS
+        *payload: Hashable positional arguments for the builder
+    """
+    st.plotly_chart(json.loads(_fig_json(kind, payload)), use_container_width=True)
+
+def _energy_gradient_styles(energies):
+    """
+    Build per-row CSS for a YlOrRd background gradient over energy values,
+    avoiding the matplotlib colormap that Styler.background_gradient pulls in
     
-    .stTextInput > div > div > input {
-        background: rgba(255,255,255,0.9);
-        border: 2px solid rgba(255,255,255,0.3);
-        border-radius: 10px;
-        color: #333;
-        font-weight: 500;
-    }
+    Args:
+        energies (np.ndarray): Total energy per day in kWh
     
-    .stTextInput > div > div > input:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 10px rgba(102,126,234,0.5);
-    }
+    Returns:
+        list: One CSS declaration string per value
+    """
+    norm = (energies - energies.min()) / max(np.ptp(energies), 1e-9)
+    stops = np.linspace(0.0, 1.0, len(_YLORRD))
+    rgb = np.column_stack([np.interp(norm, stops, _YLORRD[:, c]) for c in range(3)])
+    
+    # Pick a readable text color the same way pandas does (relative luminance)
+    linear = np.where(rgb / 255 <= 0.04045, rgb / 255 / 12.92, ((rgb / 255 + 0.055) / 1.055) ** 2.4)
+    luminance = linear @ np.array([0.2126, 0.7152, 0.0722])
+    
+    return [
+        f"background-color: #{r:02x}{g:02x}{b:02x}; color: {'#f1f1f1' if lum < 0.408 else '#000000'};"
+        for (r, g, b), lum in zip(np.rint(rgb).astype(int), luminance)
+    ]
+
+def _temperature_editor(days):
+    """
+    Render a single editable table holding every day's temperature
     
-    .stNumberInput > div > div > input {
-        background: rgba(255,255,255,0.9);
-        border: 2px solid rgba(255,255,255,0.3);
-        border-radius: 10px;
-        color: #333;
-        font-weight: 500;
-    }
+    Args:
+        days (list): Day names, one row each
     
-    .stSlider {
-        background: rgba(255,255,255,0.1);
-        padding: 1rem;
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-    }
+    Returns:
+        np.ndarray: Daily temperatures in Celsius
+    """
+    import pandas as pd
+    
+    temps_df = pd.DataFrame({'Day': days, 'Temperature': [25] * len(days)})
+    edited = st.data_editor(
+        temps_df,
+        key="temps_editor",
+        hide_index=True,
+        disabled=['Day'],
+        use_container_width=True,
+        column_config={
+            'Temperature': st.column_config.NumberColumn(
+                "Temperature (°C)",
+                min_value=10,
+                max_value=45,
+                step=1,
+                required=True
+            )
+        }
+    )
+    return edited['Temperature'].to_numpy(dtype=np.float64)
+
+def _weekly_df(flat_tenement, bhk, days, temperatures):
+    """
+    Get the weekly energy DataFrame memoized in session state
     
-    .stAlert {
-        background: rgba(255,255,255,0.9);
-        border-radius: 15px;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255,255,255,0.3);
-    }
+    The week is only recomputed when the housing selection or any of the
+    temperatures changed since the last rerun.
     
-    h1, h2, h3 {
-        font-family: 'Poppins', sans-serif;
-        color: white;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
+    Args:
+        flat_tenement (str): Housing type
+        bhk (str): BHK configuration
+        days (list): Day names, one per temperature
+        temperatures (np.ndarray): Daily temperatures in Celsius
     
-    .stMarkdown {
-        color: white;
-        text-shadow: 1px 1px 2px rgba(0,0,0,0.3);
-    }
+    Returns:
+        pd.DataFrame: One row per day with total and per-category energy
+    """
+    df = st.session_state.get('weekly_df')
+    if (df is None
+            or st.session_state.get('weekly_housing') != (flat_tenement, bhk)
+            or not np.array_equal(df['Temperature'].to_numpy(), temperatures)):
+        df = calculate_weekly_energy(flat_tenement, bhk, days, temperatures)
+        st.session_state['weekly_df'] = df
+        st.session_state['weekly_housing'] = (flat_tenement, bhk)
+    
+    return df
+
+def render_day(day, temperature, flat_tenement, bhk):
+    """
+    Render a single day's tab: weather card and energy breakdown
     
-    .bright-card {
-        background: linear-gradient(135deg, #667eea, #764ba2);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 20px;
-        margin: 1rem 0;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-        border: 2px solid rgba(255,255,255,0.2);
-        backdrop-filter: blur(10px);
-    }
+    Args:
+        day (str): Day name
+        temperature (float): Day temperature in Celsius
+        flat_tenement (str): Housing type
+        bhk (str): BHK configuration
+    """
+    col1, col2 = st.columns([1, 1])
     
-    .glow-text {
-        text-shadow: 0 0 10px rgba(255,255,255,0.8);
-        font-weight: 700;
-    }
-    </style>
+    with col1:
+        st.subheader(f"🌡️ Weather for {day}")
+        
+        # Weather description based on temperature, using the same bands as the fan/AC multiplier
+        band = int(_temperature_band(temperature))
+        weather_desc, weather_gradient = _WEATHER[band]
+        
+        st.markdown(f"""
+        <div class="bright-card" style="background: {weather_gradient}; text-align: center; animation: float 3s ease-in-out infinite;">
+            <h3 class="glow-text" style="margin: 0; font-size: 1.5rem;">{weather_desc}</h3>
+            <h2 class="glow-text" style="margin: 0.5rem 0; font-size: 2.5rem;">{temperature:.0f}°C</h2>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.subheader("⚡ Energy Calculation")
+        
+        daily_energy = calculate_daily_energy(flat_tenement, bhk, temperature, band)
+        
+        if daily_energy is not None:
+            # Display daily breakdown
+            st.metric(
+                label="Total Daily Consumption",
+                value=f"{daily_energy[CAT_TOTAL]:.2f} kWh",
+                delta=f"₹{daily_energy[CAT_TOTAL] * 6:.2f}"
+            )
+            
+            # Energy breakdown chart
+            _plotly_chart(
+                'pie',
+                tuple(daily_energy[:CAT_TOTAL]),
+                _BREAKDOWN_CATEGORIES,
+                f"Energy Breakdown - {day}"
+            )
+            
+            # Energy saving tips based on weather
+            if temperature > 30:
+                st.markdown("""
+                <div class="bright-card" style="background: linear-gradient(135deg, #fd79a8, #e84393);">
+                    <h4 style="margin: 0; color: white;">🔥 Hot Day Tips</h4>
+                    <p style="margin: 0.5rem 0; color: white;">Use AC efficiently, close curtains during day, use fans with AC</p>
+                </div>
+                """, unsafe_allow_html=True)
+            elif temperature < 20:
+                st.markdown("""
+                <div class="bright-card" style="background: linear-gradient(135deg, #74b9ff, #0984e3);">
+                    <h4 style="margin: 0; color: white;">❄️ Cold Day Tips</h4>
+                    <p style="margin: 0.5rem 0; color: white;">Reduced fan usage, use natural light, water heater usage may increase</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown("""
+                <div class="bright-card" style="background: linear-gradient(135deg, #00b894, #55a3ff);">
+                    <h4 style="margin: 0; color: white;">😊 Comfortable Day Tips</h4>
+                    <p style="margin: 0.5rem 0; color: white;">Perfect weather for natural ventilation, minimal AC usage needed</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+def render_about():
+    """
+    Render the static "About This Calculator" section
+    """
+    st.markdown("---")
+    st.markdown("""
+    <div class="bright-card" style="background: linear-gradient(135deg, #ff9ff3, #48dbfb); text-align: center; margin: 2rem 0;">
+        <h2 class="glow-text" style="margin: 0; font-size: 2rem;">ℹ️ About This Calculator</h2>
+    </div>
     """, unsafe_allow_html=True)
     
+    with st.expander("How does weather affect energy consumption?"):
+        st.write("""
+        🌡️ **Temperature Impact on Energy Usage:**
+        
+        **Very Cold (Below 18°C):** ❄️
+        - Fan usage drops to 10% of normal
+        - Water heater usage may increase
+        - Minimal air conditioning needed
+        
+        **Cool (18-22°C):** 🌤️
+        - Fan usage at 30% of normal
+        - Comfortable temperature, minimal cooling needed
+        
+        **Comfortable (22-26°C):** 😊
+        - Fan usage at 60% of normal
+        - Optimal temperature for energy efficiency
+        
+        **Warm (26-30°C):** 🌞
+        - Fan usage at 80% of normal
+        - May need occasional air conditioning
+        
+        **Hot (30-35°C):** 🔥
+        - Full fan usage
+        - Air conditioning becomes necessary
+        
+        **Very Hot (Above 35°C):** 🌋
+        - Fan usage at 130% (includes AC)
+        - High cooling requirements
+        """)
+    
+    with st.expander("Energy calculation methodology"):
+        st.write("""
+        📊 **Realistic Energy Consumption (kWh per day):**
+        
+        **Flats:**
+        - 1BHK: ~12.8 kWh/day
+        - 2BHK: ~17.2 kWh/day  
+        - 3BHK: ~22.2 kWh/day
+        
+        **Tenements:**
+        - 1BHK: ~12.9 kWh/day
+        - 2BHK: ~17.3 kWh/day
+        - 3BHK: ~22.5 kWh/day
+        
+        **Appliance-wise breakdown:**
+        - 💡 Lighting: LED bulbs and tube lights
+        - 🌀 Fan/AC: Ceiling fans and air conditioning
+        - 📱 Appliances: TV, washing machine, microwave
+        - 🚿 Water Heater: Electric geyser
+        - ❄️ Refrigerator: Standard home refrigerator
+        
+        *Values based on average Indian household consumption patterns*
+        """)
+
+def main():
+    # Custom CSS for bright, glowing UI
+    st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
+    
+    # App header and the Personal Information section header, sent as one element
     st.markdown("""
     <div class="main-header">
         <h1>⚡ Smart Energy Consumption Calculator 🏠</h1>
         <p>Track your daily energy usage with weather-smart calculations</p>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Personal Information Section in Main Area
-    st.markdown("""
     <div class="bright-card" style="background: linear-gradient(135deg, #667eea, #764ba2); text-align: center; margin: 2rem 0;">
         <h2 class="glow-text" style="margin: 0; font-size: 2rem;">👤 Personal Information</h2>
     </div>
@@ -400,6 +900,18 @@ def main():
             help="Select your BHK configuration"
         )
     
+    # Everything below needs personal information, so skip rendering the
+    # day tabs and weekly summary entirely until it has been filled in
+    if not (name.strip() and city.strip() and area.strip()):
+        st.markdown("""
+        <div class="bright-card" style="background: linear-gradient(135deg, #ff9ff3, #feca57); text-align: center;">
+            <h4 style="margin: 0; color: white;">⚠️ Getting Started</h4>
+            <p style="margin: 0.5rem 0; color: white;">Please fill in your personal information above first! ⬆️</p>
+        </div>
+        """, unsafe_allow_html=True)
+        render_about()
+        return
+    
     # Main content area
     st.header("📅 Weekly Energy Tracking")
     
@@ -407,211 +919,53 @@ def main():
     days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
     day_emojis = ["🌅", "🌤️", "⛅", "🌞", "🌆", "🌙", "🌟"]
     
+    # All seven temperatures are edited in one widget, so a change is a single rerun
+    st.subheader("🌡️ Daily Temperatures")
+    temps = _temperature_editor(days)
+    
+    # Weekly data is kept in session state and only rebuilt when inputs change
+    df = _weekly_df(flat_tenement, bhk, days, temps)
+    
     # Create tabs for each day
     tabs = st.tabs([f"{emoji} {day}" for emoji, day in zip(day_emojis, days)])
     
-    weekly_data = []
-    
-    for i, (tab, day) in enumerate(zip(tabs, days)):
+    for tab, day, temperature in zip(tabs, days, temps):
         with tab:
-            col1, col2 = st.columns([1, 1])
-            
-            with col1:
-                st.subheader(f"🌡️ Weather for {day}")
-                temperature = st.slider(
-                    f"Temperature (°C) - {day}",
-                    min_value=10,
-                    max_value=45,
-                    value=25,
-                    key=f"temp_{i}"
-                )
-                
-                # Weather description based on temperature
-                if temperature < 18:
-                    weather_desc = "❄️ Very Cold"
-                    weather_gradient = "linear-gradient(135deg, #74b9ff, #0984e3)"
-                elif temperature < 22:
-                    weather_desc = "🌤️ Cool"
-                    weather_gradient = "linear-gradient(135deg, #00cec9, #00b894)"
-                elif temperature < 26:
-                    weather_desc = "😊 Comfortable"
-                    weather_gradient = "linear-gradient(135deg, #00b894, #55a3ff)"
-                elif temperature < 30:
-                    weather_desc = "🌞 Warm"
-                    weather_gradient = "linear-gradient(135deg, #fdcb6e, #f39c12)"
-                elif temperature < 35:
-                    weather_desc = "🔥 Hot"
-                    weather_gradient = "linear-gradient(135deg, #fd79a8, #e84393)"
-                else:
-                    weather_desc = "🌋 Very Hot"
-                    weather_gradient = "linear-gradient(135deg, #ff6b6b, #ee5253)"
-                
-                st.markdown(f"""
-                <div class="bright-card" style="background: {weather_gradient}; text-align: center; animation: float 3s ease-in-out infinite;">
-                    <h3 class="glow-text" style="margin: 0; font-size: 1.5rem;">{weather_desc}</h3>
-                    <h2 class="glow-text" style="margin: 0.5rem 0; font-size: 2.5rem;">{temperature}°C</h2>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.subheader("⚡ Energy Calculation")
-                
-                if name.strip() and city.strip() and area.strip():
-                    daily_energy = calculate_daily_energy(flat_tenement, bhk, temperature)
-                    
-                    if daily_energy:
-                        # Store data for weekly summary
-                        weekly_data.append({
-                            'Day': day,
-                            'Temperature': temperature,
-                            'Total Energy': daily_energy['total'],
-                            'Lighting': daily_energy['lighting'],
-                            'Fan/AC': daily_energy['fan_ac'],
-                            'Appliances': daily_energy['appliances'],
-                            'Water Heater': daily_energy['water_heater'],
-                            'Refrigerator': daily_energy['refrigerator']
-                        })
-                        
-                        # Display daily breakdown
-                        st.metric(
-                            label="Total Daily Consumption",
-                            value=f"{daily_energy['total']:.2f} kWh",
-                            delta=f"₹{daily_energy['total'] * 6:.2f}"
-                        )
-                        
-                        # Energy breakdown chart
-                        breakdown_data = {
-                            'Category': ['💡 Lighting', '🌀 Fan/AC', '📱 Appliances', '🚿 Water Heater', '❄️ Refrigerator'],
-                            'Energy': [daily_energy['lighting'], daily_energy['fan_ac'], daily_energy['appliances'], 
-                                     daily_energy['water_heater'], daily_energy['refrigerator']]
-                        }
-                        
-                        fig = px.pie(
-                            values=breakdown_data['Energy'],
-                            names=breakdown_data['Category'],
-                            title=f"Energy Breakdown - {day}",
-                            color_discrete_sequence=['#ff6b6b', '#feca57', '#48dbfb', '#ff9ff3', '#54a0ff']
-                        )
-                        fig.update_layout(
-                            height=400,
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            title_font_color='white',
-                            title_font_size=18,
-                            font_color='white',
-                            title_x=0.5
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Energy saving tips based on weather
-                        if temperature > 30:
-                            st.markdown("""
-                            <div class="bright-card" style="background: linear-gradient(135deg, #fd79a8, #e84393);">
-                                <h4 style="margin: 0; color: white;">🔥 Hot Day Tips</h4>
-                                <p style="margin: 0.5rem 0; color: white;">Use AC efficiently, close curtains during day, use fans with AC</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        elif temperature < 20:
-                            st.markdown("""
-                            <div class="bright-card" style="background: linear-gradient(135deg, #74b9ff, #0984e3);">
-                                <h4 style="margin: 0; color: white;">❄️ Cold Day Tips</h4>
-                                <p style="margin: 0.5rem 0; color: white;">Reduced fan usage, use natural light, water heater usage may increase</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        else:
-                            st.markdown("""
-                            <div class="bright-card" style="background: linear-gradient(135deg, #00b894, #55a3ff);">
-                                <h4 style="margin: 0; color: white;">😊 Comfortable Day Tips</h4>
-                                <p style="margin: 0.5rem 0; color: white;">Perfect weather for natural ventilation, minimal AC usage needed</p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                        
-                else:
-                    st.markdown("""
-                    <div class="bright-card" style="background: linear-gradient(135deg, #ff9ff3, #feca57); text-align: center;">
-                        <h4 style="margin: 0; color: white;">⚠️ Getting Started</h4>
-                        <p style="margin: 0.5rem 0; color: white;">Please fill in your personal information above first! ⬆️</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            render_day(day, temperature, flat_tenement, bhk)
     
     # Weekly summary section
-    if weekly_data:
+    if df is not None:
         st.markdown("""
         <div class="bright-card" style="background: linear-gradient(135deg, #667eea, #764ba2); text-align: center; margin: 2rem 0;">
             <h2 class="glow-text" style="margin: 0; font-size: 2rem;">📊 Weekly Energy Summary</h2>
         </div>
         """, unsafe_allow_html=True)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(weekly_data)
+        # Weekly totals, all derived from a single pass over the energy column
+        te = df['Total Energy'].to_numpy()
+        total_energy = te.sum()
+        avg_energy = total_energy / te.size
+        highest_day = df['Day'].iat[int(te.argmax())]
         
-        # Weekly totals
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.metric("Total Weekly Energy", f"{df['Total Energy'].sum():.2f} kWh")
+            st.metric("Total Weekly Energy", f"{total_energy:.2f} kWh")
         
         with col2:
-            st.metric("Average Daily Energy", f"{df['Total Energy'].mean():.2f} kWh")
+            st.metric("Average Daily Energy", f"{avg_energy:.2f} kWh")
         
         with col3:
-            st.metric("Estimated Monthly Bill", f"₹{df['Total Energy'].sum() * 4.3 * 6:.2f}")
+            st.metric("Estimated Monthly Bill", f"₹{total_energy * 4.3 * 6:.2f}")
         
         with col4:
-            highest_day = df.loc[df['Total Energy'].idxmax(), 'Day']
             st.metric("Highest Consumption Day", highest_day)
         
         # Weekly trends chart
-        fig_line = px.line(
-            df, 
-            x='Day', 
-            y='Total Energy',
-            title='📈 Weekly Energy Consumption Trend',
-            markers=True,
-            color_discrete_sequence=['#ff6b6b']
-        )
-        fig_line.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            title_font_color='white',
-            title_font_size=18,
-            font_color='white',
-            title_x=0.5,
-            xaxis=dict(gridcolor='rgba(255,255,255,0.2)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.2)')
-        )
-        fig_line.update_traces(
-            line=dict(width=4),
-            marker=dict(size=10, line=dict(width=2, color='white'))
-        )
-        st.plotly_chart(fig_line, use_container_width=True)
+        _plotly_chart('line', tuple(df['Day']), tuple(te))
         
         # Temperature vs Energy correlation
-        fig_scatter = px.scatter(
-            df,
-            x='Temperature',
-            y='Total Energy',
-            title='🌡️ Temperature vs Energy Consumption',
-            trendline='ols',
-            hover_data=['Day'],
-            color_discrete_sequence=['#feca57']
-        )
-        fig_scatter.update_layout(
-            height=400,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            title_font_color='white',
-            title_font_size=18,
-            font_color='white',
-            title_x=0.5,
-            xaxis=dict(gridcolor='rgba(255,255,255,0.2)'),
-            yaxis=dict(gridcolor='rgba(255,255,255,0.2)')
-        )
-        fig_scatter.update_traces(
-            marker=dict(size=12, line=dict(width=2, color='white'))
-        )
-        st.plotly_chart(fig_scatter, use_container_width=True)
+        _plotly_chart('scatter', tuple(df['Day']), tuple(df['Temperature']), tuple(te))
         
         # Detailed weekly breakdown
         st.subheader("📋 Detailed Weekly Breakdown")
@@ -625,7 +979,9 @@ def main():
             'Appliances': '{:.2f}',
             'Water Heater': '{:.2f}',
             'Refrigerator': '{:.2f}'
-        }).background_gradient(subset=['Total Energy'], cmap='YlOrRd')
+        })
+        energy_styles = _energy_gradient_styles(te)
+        styled_df = styled_df.apply(lambda col: energy_styles, subset=['Total Energy'])
         
         st.dataframe(styled_df, use_container_width=True)
         
@@ -636,96 +992,27 @@ def main():
         </div>
         """, unsafe_allow_html=True)
         
-        avg_temp = df['Temperature'].mean()
-        avg_energy = df['Total Energy'].mean()
-        
-        recommendations = []
-        
-        if avg_temp > 30:
-            recommendations.append("🔥 Install ceiling fans to reduce AC load by 20-30%")
-            recommendations.append("🌞 Use solar water heater to reduce electricity consumption")
-            recommendations.append("🏠 Improve insulation to maintain cool temperatures")
-        
-        if avg_energy > 15:
-            recommendations.append("💡 Switch to LED lights to reduce lighting energy by 80%")
-            recommendations.append("⭐ Look for 5-star rated appliances for better efficiency")
-            recommendations.append("🕒 Use timer-based water heaters")
-        
-        if flat_tenement == "tenement":
-            recommendations.append("🏡 Consider rainwater harvesting to reduce water heating needs")
-            recommendations.append("🌱 Plant trees around the house for natural cooling")
+        stats = _Stats(
+            avg_temp=df['Temperature'].to_numpy().mean(),
+            avg_energy=avg_energy,
+            flat_tenement=flat_tenement
+        )
         
-        recommendations.append("📱 Use smart power strips to eliminate standby power consumption")
-        recommendations.append("🌀 Set AC temperature to 24°C instead of lower temperatures")
+        # dict.fromkeys drops any message matched by more than one rule, keeping order
+        recommendations = list(dict.fromkeys(
+            [msg for pred, msg in _RULES if pred(stats)] + list(_ALWAYS_TIPS)
+        ))
         
-        for i, rec in enumerate(recommendations, 1):
-            st.markdown(f"""
+        # Render all recommendation cards as a single markdown element
+        rec_cards = "".join(f"""
             <div class="bright-card" style="background: linear-gradient(135deg, #48dbfb, #54a0ff); margin: 0.5rem 0;">
                 <p style="margin: 0; color: white; font-weight: 500;">{i}. {rec}</p>
             </div>
-            """, unsafe_allow_html=True)
+            """ for i, rec in enumerate(recommendations, 1))
+        st.markdown(rec_cards, unsafe_allow_html=True)
     
     # Information section
-    st.markdown("---")
-    st.markdown("""
-    <div class="bright-card" style="background: linear-gradient(135deg, #ff9ff3, #48dbfb); text-align: center; margin: 2rem 0;">
-        <h2 class="glow-text" style="margin: 0; font-size: 2rem;">ℹ️ About This Calculator</h2>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    with st.expander("How does weather affect energy consumption?"):
-        st.write("""
-        🌡️ **Temperature Impact on Energy Usage:**
-        
-        **Very Cold (Below 18°C):** ❄️
-        - Fan usage drops to 10% of normal
-        - Water heater usage may increase
-        - Minimal air conditioning needed
-        
-        **Cool (18-22°C):** 🌤️
-        - Fan usage at 30% of normal
-        - Comfortable temperature, minimal cooling needed
-        
-        **Comfortable (22-26°C):** 😊
-        - Fan usage at 60% of normal
-        - Optimal temperature for energy efficiency
-        
-        **Warm (26-30°C):** 🌞
-        - Fan usage at 80% of normal
-        - May need occasional air conditioning
-        
-        **Hot (30-35°C):** 🔥
-        - Full fan usage
-        - Air conditioning becomes necessary
-        
-        **Very Hot (Above 35°C):** 🌋
-        - Fan usage at 130% (includes AC)
-        - High cooling requirements
-        """)
-    
-    with st.expander("Energy calculation methodology"):
-        st.write("""
-        📊 **Realistic Energy Consumption (kWh per day):**
-        
-        **Flats:**
-        - 1BHK: ~12.8 kWh/day
-        - 2BHK: ~17.2 kWh/day  
-        - 3BHK: ~22.2 kWh/day
-        
-        **Tenements:**
-        - 1BHK: ~12.9 kWh/day
-        - 2BHK: ~17.3 kWh/day
-        - 3BHK: ~22.5 kWh/day
-        
-        **Appliance-wise breakdown:**
-        - 💡 Lighting: LED bulbs and tube lights
-        - 🌀 Fan/AC: Ceiling fans and air conditioning
-        - 📱 Appliances: TV, washing machine, microwave
-        - 🚿 Water Heater: Electric geyser
-        - ❄️ Refrigerator: Standard home refrigerator
-        
-        *Values based on average Indian household consumption patterns*
-        """)
+    render_about()
 
 if __name__ == "__main__":
     main()